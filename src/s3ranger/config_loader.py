@@ -0,0 +1,62 @@
+"""Loading and merging of the S3Ranger configuration file.
+
+Kept separate from s3ranger.config so importing the config model and paths
+does not pull in the TOML parser.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from s3ranger.config import (
+    CONFIG_FILE_PATH,
+    S3_CONFIG_FIELD_NAMES,
+    S3_CONFIG_FIELD_NAMES_SET,
+    S3Config,
+)
+
+
+def load_config(config_file_path: Optional[str] = None) -> S3Config:
+    """Load configuration from file."""
+    if config_file_path:
+        config_path = Path(config_file_path)
+    else:
+        config_path = CONFIG_FILE_PATH
+
+    if not config_path.exists():
+        return S3Config()
+
+    try:
+        # Imported here so callers that never read a config file don't load the parser
+        import tomllib
+
+        with open(config_path, "rb") as f:
+            config_data = tomllib.load(f)
+
+        # Filter config data to only include fields that belong to S3Config
+        filtered_config = {
+            key: value
+            for key, value in config_data.items()
+            if key in S3_CONFIG_FIELD_NAMES_SET
+        }
+
+        return S3Config(**filtered_config)
+
+    except Exception as e:
+        raise ValueError(f"Error loading config file {config_path}: {e}")
+
+
+def merge_config_with_cli_args(config: S3Config, **cli_args) -> S3Config:
+    """Merge configuration with CLI arguments, giving priority to CLI args."""
+    # Start with config values
+    merged_config = {}
+
+    # Add all config values
+    for field_name in S3_CONFIG_FIELD_NAMES:
+        merged_config[field_name] = getattr(config, field_name)
+
+    # Override with CLI args where provided (not None)
+    for key, value in cli_args.items():
+        if value is not None:
+            merged_config[key] = value
+
+    return S3Config(**merged_config)
@@ -12,9 +12,7 @@ from typing import Any, Dict
 import click
 
 from s3ranger import __version__
-from s3ranger.config import CONFIG_FILE_PATH, load_config, resolve_download_directory
 from s3ranger.credentials import resolve_credentials
-from s3ranger.ui.app import S3Ranger
 from s3ranger.ui.constants import DEFAULT_DOWNLOAD_DIRECTORY
 
 # Constants
@@ -28,10 +26,10 @@ def _load_existing_config(config_path: Path) -> Dict[str, Any]:
         return {}
 
     try:
-        import toml
+        import tomllib
 
-        with open(config_path, "r") as f:
-            config = toml.load(f)
+        with open(config_path, "rb") as f:
+            config = tomllib.load(f)
         click.echo(f"Found existing configuration at {config_path}")
         click.echo()
         return config
@@ -255,6 +253,8 @@ def cli(
 )
 def configure(config: str | None = None):
     """Interactive configuration setup for S3Ranger"""
+    from s3ranger.config import CONFIG_FILE_PATH
+
     # Determine config file path
     config_path = CONFIG_FILE_PATH
     if config:
@@ -300,6 +300,12 @@ def main(
     download_directory: str | None = None,
 ):
     """S3 Terminal UI - Browse and manage S3 buckets and objects."""
+    # Deferred so that --help, configure and argument errors don't pay for
+    # the config parser, Textual and boto3 imports
+    from s3ranger.config import resolve_download_directory
+    from s3ranger.config_loader import load_config
+    from s3ranger.ui.app import S3Ranger
+
     try:
         # Load configuration from file
         config_obj = load_config(config)
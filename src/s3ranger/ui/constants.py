@@ -5,6 +5,10 @@ DEFAULT_DOWNLOAD_DIRECTORY = "~/Downloads/"
 BUCKET_LIST_PAGE_SIZE = 250  # Number of buckets to load per page
 OBJECT_LIST_PAGE_SIZE = 25  # Number of objects to load per page
 
+# Listing cache constants
+OBJECT_PAGE_CACHE_TTL_SECONDS = 60  # How long a cached first page of a listing may be served
+OBJECT_PAGE_CACHE_MAX_ENTRIES = 256  # Oldest (bucket, prefix) pages are evicted past this
+
 # Filter constants
 BUCKET_FILTER_DEBOUNCE_MS = 200  # Debounce time for server-side filter requests in milliseconds
 
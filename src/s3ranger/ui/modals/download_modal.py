@@ -6,6 +6,7 @@ import threading
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
+from textual.content import Content
 from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static
@@ -15,6 +16,12 @@ from s3ranger.gateways.s3 import S3
 from s3ranger.ui.constants import DEFAULT_DOWNLOAD_DIRECTORY
 from s3ranger.ui.widgets import ProgressWidget
 
+# Footer keybinding hints never change, so parse their markup once at import
+_KB_NAVIGATE = Content.from_markup("[bold white]Tab[/] Navigate")
+_KB_DOWNLOAD = Content.from_markup("[bold white]Ctrl+Enter[/] Download")
+_KB_CANCEL = Content.from_markup("[bold white]Esc[/] Cancel")
+_KB_FILE_PICKER = Content.from_markup("[bold white]Ctrl+O[/] Open File Picker")
+
 
 class DownloadModal(ModalScreen[bool]):
     """Modal screen for downloading files from S3."""
@@ -94,17 +101,11 @@ class DownloadModal(ModalScreen[bool]):
                 with Horizontal(classes="footer-content"):
                     with Vertical(classes="keybindings-section"):
                         with Horizontal(classes="dialog-keybindings-row"):
-                            yield Static("[bold white]Tab[/] Navigate", classes="keybinding")
-                            yield Static(
-                                "[bold white]Ctrl+Enter[/] Download",
-                                classes="keybinding",
-                            )
+                            yield Static(_KB_NAVIGATE, classes="keybinding")
+                            yield Static(_KB_DOWNLOAD, classes="keybinding")
                         with Horizontal(classes="dialog-keybindings-row"):
-                            yield Static("[bold white]Esc[/] Cancel", classes="keybinding")
-                            yield Static(
-                                "[bold white]Ctrl+O[/] Open File Picker",
-                                classes="keybinding",
-                            )
+                            yield Static(_KB_CANCEL, classes="keybinding")
+                            yield Static(_KB_FILE_PICKER, classes="keybinding")
 
                     with Vertical(classes="dialog-actions"):
                         yield Button("Cancel", id="cancel-btn")
@@ -182,9 +183,6 @@ class DownloadModal(ModalScreen[bool]):
             self.notify("Please enter a destination path", severity="error")
             return
 
-        # Expand tilde to home directory
-        destination = os.path.expanduser(destination)
-
         # Start loading and perform download asynchronously
         self.is_downloading = True
 
@@ -195,6 +193,9 @@ class DownloadModal(ModalScreen[bool]):
     def _download_async(self, destination: str) -> None:
         """Asynchronously perform the download operation."""
         try:
+            # Expand tilde to home directory
+            destination = os.path.expanduser(destination)
+
             # Perform the download
             if self.is_folder:
                 S3.download_directory(s3_uri=self.s3_path, local_dir_path=destination)
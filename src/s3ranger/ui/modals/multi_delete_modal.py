@@ -176,7 +176,7 @@ class MultiDeleteModal(ModalScreen[bool]):
 
             except Exception as e:
                 failed += 1
-                print(f"Failed to delete {s3_path}: {e}")
+                self.log.error(f"Failed to delete {s3_path}: {e}")
 
         # Build completion message
         if failed == 0:
@@ -197,17 +197,6 @@ class MultiDownloadModal(ModalScreen[bool]):
             self.notify("Please enter a destination path", severity="error")
             return
 
-        # Expand tilde to home directory
-        destination = os.path.expanduser(destination)
-
-        # Ensure destination directory exists
-        if not os.path.exists(destination):
-            try:
-                os.makedirs(destination)
-            except OSError as e:
-                self.notify(f"Failed to create destination directory: {e}", severity="error")
-                return
-
         # Start loading and perform download asynchronously
         self.is_downloading = True
 
@@ -217,6 +206,17 @@ class MultiDownloadModal(ModalScreen[bool]):
 
     def _download_async(self, destination: str) -> None:
         """Asynchronously perform the download operation for multiple files."""
+        # Expand tilde to home directory
+        destination = os.path.expanduser(destination)
+
+        # Ensure destination directory exists, off the UI thread
+        try:
+            os.makedirs(destination, exist_ok=True)
+        except OSError as e:
+            error = Exception(f"Failed to create destination directory: {e}")
+            self.app.call_later(lambda: self._on_download_error(error))
+            return
+
         total = len(self.s3_paths)
         successful = 0
         failed = 0
@@ -239,7 +239,7 @@ class MultiDownloadModal(ModalScreen[bool]):
 
             except Exception as e:
                 failed += 1
-                print(f"Failed to download {s3_path}: {e}")
+                self.log.error(f"Failed to download {s3_path}: {e}")
 
         # Build completion message
         if failed == 0:
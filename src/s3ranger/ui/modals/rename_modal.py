@@ -1,6 +1,5 @@
 """Rename modal for S3Ranger."""
 
-import os
 import threading
 
 from textual.app import ComposeResult
@@ -42,6 +41,17 @@ class RenameModal(ModalScreen[bool]):
         self.is_folder = is_folder
         self.current_objects = current_objects or []
 
+        # The path is fixed for the modal's lifetime, so split it up once
+        s3_parts = s3_path.removeprefix("s3://").split("/", 1)
+        self._bucket_name = s3_parts[0]
+        current_path = s3_parts[1] if len(s3_parts) > 1 else ""
+        if is_folder and current_path.endswith("/"):
+            current_path = current_path[:-1]
+        self._current_path = current_path
+        name_start = current_path.rfind("/") + 1
+        self._parent_prefix = current_path[:name_start]
+        self._current_name = current_path[name_start:] if s3_path.startswith("s3://") else ""
+
     def compose(self) -> ComposeResult:
         """Compose the modal layout."""
         with Container(id="rename-dialog"):
@@ -102,8 +112,7 @@ class RenameModal(ModalScreen[bool]):
 
     def on_mount(self) -> None:
         """Called when the modal is mounted."""
-        # Extract the current name from the S3 path
-        current_name = self._extract_name_from_s3_path(self.s3_path)
+        current_name = self._current_name
 
         # Update the current name field
         current_name_field = self.query_one("#current-name-field", Static)
@@ -116,25 +125,6 @@ class RenameModal(ModalScreen[bool]):
         # Focus the input field
         new_name_input.focus()
 
-    def _extract_name_from_s3_path(self, s3_path: str) -> str:
-        """Extract the file/folder name from S3 path."""
-        if not s3_path or not s3_path.startswith("s3://"):
-            return ""
-
-        # Remove s3://bucket/ part
-        path_parts = s3_path.replace("s3://", "").split("/", 1)
-        if len(path_parts) < 2:
-            return ""
-
-        path = path_parts[1]
-
-        # For folders, remove trailing slash
-        if self.is_folder and path.endswith("/"):
-            path = path[:-1]
-
-        # Get the last part (filename/foldername)
-        return os.path.basename(path)
-
     def _validate_new_name(self, new_name: str) -> tuple[bool, str]:
         """Validate the new name and return (is_valid, error_message)."""
         if not new_name.strip():
@@ -234,19 +224,13 @@ class RenameModal(ModalScreen[bool]):
     def _rename_async(self, new_name: str) -> None:
         """Asynchronously perform the rename operation."""
         try:
-            # Extract bucket and current path from S3 URI
-            s3_parts = self.s3_path.replace("s3://", "").split("/", 1)
-            bucket_name = s3_parts[0]
-            current_path = s3_parts[1] if len(s3_parts) > 1 else ""
+            bucket_name = self._bucket_name
+            current_path = self._current_path
 
             # Create new path
             if self.is_folder:
                 # For folders, replace the folder name in the path
-                if current_path.endswith("/"):
-                    current_path = current_path[:-1]
-                path_parts = current_path.split("/")
-                path_parts[-1] = new_name
-                new_path = "/".join(path_parts) + "/"
+                new_path = f"{self._parent_prefix}{new_name}/"
 
                 # Use move_directory for folders
                 S3.move_directory(
@@ -258,9 +242,7 @@ class RenameModal(ModalScreen[bool]):
                 item_type = "Folder"
             else:
                 # For files, replace the filename in the path
-                path_parts = current_path.split("/")
-                path_parts[-1] = new_name
-                new_path = "/".join(path_parts)
+                new_path = f"{self._parent_prefix}{new_name}"
 
                 # Use move_file for files
                 S3.move_file(
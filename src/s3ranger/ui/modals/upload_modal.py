@@ -1,18 +1,19 @@
 """Upload modal for S3Ranger."""
 
 import os
+import stat
 import threading
-from pathlib import Path
 
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
 from textual.screen import ModalScreen
-from textual.widgets import Button, Input, Label, Static
+from textual.widgets import Button, Checkbox, Input, Label, Static
 from textual_fspicker import FileOpen, SelectDirectory
 
 from s3ranger.gateways.s3 import S3
+from s3ranger.ui.utils import format_error_message
 from s3ranger.ui.widgets import ProgressWidget
 
 FILE_PICKER_DEFAULT_PATH = "~/"
@@ -72,6 +73,14 @@ class UploadModal(ModalScreen[bool]):
                         "Local path to upload from (~ expands to home directory)",
                         classes="field-help",
                     )
+                    yield Checkbox(
+                        "Bundle folder as a single .tar archive",
+                        id="bundle-archive-checkbox",
+                    )
+                    yield Label(
+                        "Faster for folders with many small files; ignored for single files",
+                        classes="field-help",
+                    )
 
                 # Destination field (read-only S3 path)
                 with Vertical(classes="field-group"):
@@ -180,39 +189,53 @@ class UploadModal(ModalScreen[bool]):
         # Expand tilde to home directory
         source = os.path.expanduser(source)
 
-        # Check if source exists
-        source_path = Path(source)
-        if not source_path.exists():
+        # Check if source exists; one stat answers both "exists" and "is directory"
+        try:
+            is_dir = stat.S_ISDIR(os.stat(source).st_mode)
+        except OSError:
             self.notify(f"Source path does not exist: {source}", severity="error")
             return
 
+        # Fail fast rather than after the transfer has started (and possibly
+        # opened a multipart upload that then has to be aborted)
+        if not os.access(source, os.R_OK):
+            self.notify(f"Source path is not readable: {source}", severity="error")
+            return
+
+        as_archive = self.query_one("#bundle-archive-checkbox", Checkbox).value
+
         # Start loading and perform upload asynchronously
         self.is_uploading = True
 
         # Use threading to upload asynchronously
-        thread = threading.Thread(target=self._upload_async, args=(source,), daemon=True)
+        thread = threading.Thread(
+            target=self._upload_async,
+            args=(source, is_dir, as_archive),
+            daemon=True,
+        )
         thread.start()
 
-    def _upload_async(self, source: str) -> None:
+    def _upload_async(self, source: str, is_dir: bool, as_archive: bool = False) -> None:
         """Asynchronously perform the upload operation."""
         try:
-            source_path = Path(source)
-
             # Perform the upload
-            if source_path.is_dir():
+            if is_dir and as_archive:
+                key = S3.upload_directory_as_tar(local_dir_path=source, s3_uri=self.s3_path)
+                message = f"Directory uploaded as archive {key}"
+            elif is_dir:
                 S3.upload_directory(local_dir_path=source, s3_uri=self.s3_path)
                 message = f"Directory uploaded from {source}"
             else:
                 S3.upload_file(local_file_path=source, s3_uri=self.s3_path)
                 message = f"File uploaded from {source}"
 
-            # Update state on the main thread using call_later
-            self.app.call_later(lambda: self._on_upload_success(message))
+            # Hand completion straight to the main thread; the worker has nothing
+            # left to do, so blocking until the handler has run is harmless
+            self.app.call_from_thread(self._on_upload_success, message)
 
         except Exception as e:
-            # Handle upload errors gracefully - capture exception in closure
-            error = e
-            self.app.call_later(lambda: self._on_upload_error(error))
+            # Handle upload errors gracefully
+            self.app.call_from_thread(self._on_upload_error, e)
 
     def _on_upload_success(self, message: str) -> None:
         """Handle successful upload completion."""
@@ -223,7 +246,7 @@ class UploadModal(ModalScreen[bool]):
     def _on_upload_error(self, error: Exception) -> None:
         """Handle upload error."""
         self.is_uploading = False
-        self.notify(f"Upload failed: {str(error)}", severity="error")
+        self.notify(f"Upload failed: {format_error_message(error)}", severity="error")
 
     @work
     async def action_file_picker(self) -> None:
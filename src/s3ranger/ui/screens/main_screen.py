@@ -4,7 +4,6 @@ from textual.containers import Container
 from textual.screen import Screen
 from textual.widgets import Footer, ListView
 
-from s3ranger.ui.modals.help_modal import HelpModal
 from s3ranger.ui.widgets.bucket_list import BucketList
 from s3ranger.ui.widgets.object_list import ObjectList
 from s3ranger.ui.widgets.title_bar import TitleBar
@@ -32,37 +31,52 @@ class MainScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when the screen is mounted. Set initial focus."""
-        # Set initial focus to bucket list
-        bucket_list = self.query_one("#bucket-list", BucketList)
+        # Cache widget references so key handlers don't re-query the DOM
+        self._bucket_list = self.query_one("#bucket-list", BucketList)
+        self._object_list = self.query_one("#object-list", ObjectList)
         try:
-            bucket_list_view = bucket_list.query_one("#bucket-list-view", ListView)
-            bucket_list_view.focus()
+            self._bucket_list_view = self._bucket_list.query_one(
+                "#bucket-list-view", ListView
+            )
+            self._object_list_view = self._object_list.query_one(
+                "#object-list", ListView
+            )
         except Exception:
-            bucket_list.focus()
+            self._bucket_list_view = None
+            self._object_list_view = None
+
+        # Set initial focus to bucket list
+        if self._bucket_list_view is not None:
+            self._bucket_list_view.focus()
+        else:
+            self._bucket_list.focus()
 
     def on_bucket_list_bucket_selected(
         self, message: BucketList.BucketSelected
     ) -> None:
         """Handle bucket selection from BucketList widget"""
-        object_list = self.query_one("#object-list", ObjectList)
-        object_list.set_bucket(message.bucket_name)
+        self._object_list.set_bucket(message.bucket_name)
+        # Users tend to browse buckets in order, so warm up the neighbours
+        for bucket_name in self._bucket_list.get_adjacent_bucket_names(
+            message.bucket_name
+        ):
+            self._object_list.prefetch_bucket(bucket_name)
 
     def action_switch_panel(self) -> None:
         """Switch focus between bucket list and object list"""
-        bucket_list = self.query_one("#bucket-list", BucketList)
-        object_list = self.query_one("#object-list", ObjectList)
-
-        # Try to find the focusable components within each widget
-        try:
-            bucket_list_view = bucket_list.query_one("#bucket-list-view", ListView)
-            object_list_view = object_list.query_one("#object-list", ListView)
+        bucket_list = self._bucket_list
+        object_list = self._object_list
+        bucket_list_view = self._bucket_list_view
+        object_list_view = self._object_list_view
 
+        # Prefer the focusable components within each widget
+        if bucket_list_view is not None and object_list_view is not None:
             # Check which component currently has focus
             if bucket_list_view.has_focus:
                 object_list_view.focus()
             else:
                 bucket_list_view.focus()
-        except Exception:
+        else:
             # Fallback to widget-level focus if components not found
             if bucket_list.has_focus:
                 object_list.focus()
@@ -72,19 +86,18 @@ class MainScreen(Screen):
     def action_refresh(self) -> None:
         """Refresh the current view"""
         # Remember which component currently has focus
-        bucket_list = self.query_one("#bucket-list", BucketList)
-        object_list = self.query_one("#object-list", ObjectList)
+        bucket_list = self._bucket_list
+        object_list = self._object_list
+        bucket_list_view = self._bucket_list_view
+        object_list_view = self._object_list_view
 
         focused_widget = None
-        try:
-            bucket_list_view = bucket_list.query_one("#bucket-list-view", ListView)
-            object_list_view = object_list.query_one("#object-list", ListView)
-
+        if bucket_list_view is not None and object_list_view is not None:
             if bucket_list_view.has_focus:
                 focused_widget = "bucket_list"
             elif object_list_view.has_focus:
                 focused_widget = "object_list"
-        except Exception:
+        else:
             # Fallback to widget-level focus check
             if bucket_list.has_focus:
                 focused_widget = "bucket_list"
@@ -118,24 +131,23 @@ class MainScreen(Screen):
     def _do_focus_restore(self, focused_widget: str) -> None:
         """Actually perform the focus restoration"""
         try:
-            bucket_list = self.query_one("#bucket-list", BucketList)
-            object_list = self.query_one("#object-list", ObjectList)
-
             if focused_widget == "bucket_list":
                 # Use the dedicated method to restore focus to bucket list
-                bucket_list.focus_list_view()
+                self._bucket_list.focus_list_view()
             elif focused_widget == "object_list":
                 # Use the dedicated method to restore focus to object list
-                object_list.focus_list()
+                self._object_list.focus_list()
         except Exception:
             # Fallback to widget-level focus
             if focused_widget == "bucket_list":
-                bucket_list = self.query_one("#bucket-list", BucketList)
-                bucket_list.focus()
+                self._bucket_list.focus()
             elif focused_widget == "object_list":
-                object_list = self.query_one("#object-list", ObjectList)
-                object_list.focus()
+                self._object_list.focus()
 
     def action_help(self) -> None:
         """Show help information"""
+        # Imported on first use: loading the modals package pulls in every modal
+        # and textual_fspicker, none of which the first screen needs
+        from s3ranger.ui.modals.help_modal import HelpModal
+
         self.app.push_screen(HelpModal())
@@ -101,19 +101,26 @@ class MoveScreen(Screen[bool]):
 
     def on_mount(self) -> None:
         """Called when the screen is mounted."""
-        # Set initial focus to bucket list
-        bucket_list = self.query_one("#bucket-list", BucketList)
+        # Cache widget references so key handlers don't re-query the DOM
+        self._bucket_list = self.query_one("#bucket-list", BucketList)
+        self._object_list = self.query_one("#object-list", ObjectList)
         try:
-            bucket_list_view = bucket_list.query_one("#bucket-list-view", ListView)
-            bucket_list_view.focus()
+            self._bucket_list_view = self._bucket_list.query_one("#bucket-list-view", ListView)
+            self._object_list_view = self._object_list.query_one("#object-list", ListView)
         except Exception:
-            bucket_list.focus()
+            self._bucket_list_view = None
+            self._object_list_view = None
+
+        # Set initial focus to bucket list
+        if self._bucket_list_view is not None:
+            self._bucket_list_view.focus()
+        else:
+            self._bucket_list.focus()
 
     def on_bucket_list_bucket_selected(self, message: BucketList.BucketSelected) -> None:
         """Handle bucket selection from BucketList widget."""
         self.destination_bucket = message.bucket_name
-        object_list = self.query_one("#object-list", ObjectList)
-        object_list.set_bucket(message.bucket_name)
+        self._object_list.set_bucket(message.bucket_name)
 
     def watch_is_processing(self, is_processing: bool) -> None:
         """React to processing state changes."""
@@ -139,18 +146,17 @@ class MoveScreen(Screen[bool]):
 
     def action_switch_panel(self) -> None:
         """Switch focus between bucket list and object list."""
-        bucket_list = self.query_one("#bucket-list", BucketList)
-        object_list = self.query_one("#object-list", ObjectList)
-
-        try:
-            bucket_list_view = bucket_list.query_one("#bucket-list-view", ListView)
-            object_list_view = object_list.query_one("#object-list", ListView)
+        bucket_list = self._bucket_list
+        object_list = self._object_list
+        bucket_list_view = self._bucket_list_view
+        object_list_view = self._object_list_view
 
+        if bucket_list_view is not None and object_list_view is not None:
             if bucket_list_view.has_focus:
                 object_list_view.focus()
             else:
                 bucket_list_view.focus()
-        except Exception:
+        else:
             if bucket_list.has_focus:
                 object_list.focus()
             else:
@@ -158,19 +164,18 @@ class MoveScreen(Screen[bool]):
 
     def action_refresh(self) -> None:
         """Refresh the current view."""
-        bucket_list = self.query_one("#bucket-list", BucketList)
-        object_list = self.query_one("#object-list", ObjectList)
+        bucket_list = self._bucket_list
+        object_list = self._object_list
+        bucket_list_view = self._bucket_list_view
+        object_list_view = self._object_list_view
 
         focused_widget = None
-        try:
-            bucket_list_view = bucket_list.query_one("#bucket-list-view", ListView)
-            object_list_view = object_list.query_one("#object-list", ListView)
-
+        if bucket_list_view is not None and object_list_view is not None:
             if bucket_list_view.has_focus:
                 focused_widget = "bucket_list"
             elif object_list_view.has_focus:
                 focused_widget = "object_list"
-        except Exception:
+        else:
             if bucket_list.has_focus:
                 focused_widget = "bucket_list"
             elif object_list.has_focus:
@@ -189,7 +194,7 @@ class MoveScreen(Screen[bool]):
     def action_confirm(self) -> None:
         """Confirm and execute the move/copy operation."""
         # Get current destination from object list
-        object_list = self.query_one("#object-list", ObjectList)
+        object_list = self._object_list
 
         # If object list has a bucket set, use that as destination
         if object_list.current_bucket:
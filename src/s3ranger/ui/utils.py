@@ -1,5 +1,6 @@
 from collections import namedtuple
-from urllib.parse import urlparse
+
+S3Location = namedtuple("s3_location", ["bucket", "file_key"])
 
 
 def build_s3_uri(bucket_name: str, object_key: str = "") -> str:
@@ -18,11 +19,8 @@ def parse_s3_uri(s3_uri: str) -> tuple[str, str]:
     Returns:
         Tuple of (bucket_name, object_key)
     """
-    s3_loc_obj = namedtuple("s3_location", ["bucket", "file_key"])
-    s3_res = urlparse(s3_uri)
-    s3_loc = s3_loc_obj(s3_res.netloc, s3_res.path[1:])
-
-    return s3_loc
+    bucket, _, file_key = s3_uri.removeprefix("s3://").partition("/")
+    return S3Location(bucket, file_key)
 
 
 def generate_item_id(prefix: str, identifier: str) -> str:
@@ -53,6 +51,10 @@ def extract_identifier_from_id(item_id: str, prefix: str) -> str | None:
     return
 
 
+# (divisor, unit) indexed by (bit_length - 1) // 10; index 0 is handled as plain bytes
+_SIZE_UNITS = ((1, "B"), (1 << 10, "KB"), (1 << 20, "MB"), (1 << 30, "GB"), (1 << 40, "TB"))
+
+
 def format_file_size(size: int) -> str:
     """Format file size in human-readable format.
 
@@ -60,16 +62,13 @@ def format_file_size(size: int) -> str:
         size: File size in bytes
 
     Returns:
-        Formatted size string (e.g., "1.5 MB", "250 KB")
+        Formatted size string (e.g., "1.5 MB", "250 KB", "2.0 TB")
     """
     if size < 1024:
         return f"{size} B"
-    elif size < 1024 * 1024:
-        return f"{size / 1024:.1f} KB"
-    elif size < 1024 * 1024 * 1024:
-        return f"{size / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size / (1024 * 1024 * 1024):.1f} GB"
+    # Each unit spans 10 bits, so the bit length picks the unit without a compare chain
+    divisor, unit = _SIZE_UNITS[min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)]
+    return f"{size / divisor:.1f} {unit}"
 
 
 def format_object_display_text(name: str, size: int = 0) -> str:
@@ -86,6 +85,9 @@ def format_object_display_text(name: str, size: int = 0) -> str:
     return f"{name} ({size_str})"
 
 
+FOLDER_DISPLAY_PREFIX = "📁 "
+
+
 def format_folder_display_text(name: str) -> str:
     """Format display text for a folder.
 
@@ -95,7 +97,30 @@ def format_folder_display_text(name: str) -> str:
     Returns:
         Formatted display text with folder emoji
     """
-    return f"📁 {name}"
+    return FOLDER_DISPLAY_PREFIX + name
+
+
+def format_error_message(error: Exception) -> str:
+    """Format an error for display, preferring the S3 error code and message.
+
+    botocore ClientErrors carry a parsed error response; reading it directly
+    gives a short "Code: Message" string. Checked by attribute rather than
+    isinstance so the UI doesn't have to import botocore.
+
+    Args:
+        error: The exception to format
+
+    Returns:
+        Human-readable error message
+    """
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        details = response.get("Error") or {}
+        code = details.get("Code")
+        message = details.get("Message")
+        if code and message:
+            return f"{code}: {message}"
+    return str(error)
 
 
 def get_parent_path(path: str) -> str:
@@ -107,9 +132,7 @@ def get_parent_path(path: str) -> str:
     Returns:
         Parent path or empty string if no parent
     """
-    if "/" in path:
-        return "/".join(path.split("/")[:-1])
-    return ""
+    return path.rpartition("/")[0]
 
 
 def get_current_aws_profile() -> str:
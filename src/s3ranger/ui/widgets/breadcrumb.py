@@ -59,8 +59,10 @@ class Breadcrumb(Static):
 
     def set_path(self, bucket_name: str, prefix: str = "") -> None:
         """Set both bucket name and prefix at once"""
-        self.bucket_name = bucket_name
-        self.prefix = prefix
+        # Bypass the per-field watchers so the path is rendered once, not twice
+        self.set_reactive(Breadcrumb.bucket_name, bucket_name)
+        self.set_reactive(Breadcrumb.prefix, prefix)
+        self._update_breadcrumb()
 
     def clear(self) -> None:
         """Clear the breadcrumb"""
@@ -21,19 +21,24 @@ from s3ranger.ui.widgets.title_bar import TitleBar
 class BucketItem(ListItem):
     """Individual bucket item widget"""
 
-    def __init__(self, bucket_name: str, aws_region: str = "us-east-1"):
+    def __init__(self, bucket_name: str, aws_region: str = "us-east-1", region_label: str | None = None):
         super().__init__()
         self._bucket_name = bucket_name
         self._aws_region = aws_region
+        self._region_label = region_label or f"Region: {aws_region}"
 
     def compose(self) -> ComposeResult:
         yield Label(self._bucket_name, classes="bucket-name")
-        yield Label(f"Region: {self._aws_region}", classes="bucket-meta")
+        yield Label(self._region_label, classes="bucket-meta")
 
     @property
     def bucket_name(self) -> str:
         return self._bucket_name
 
+    @property
+    def aws_region(self) -> str:
+        return self._aws_region
+
 
 class BucketList(Static):
     """Left panel widget displaying S3 buckets with filtering capability"""
@@ -55,8 +60,11 @@ class BucketList(Static):
     _loaded_bucket_names: set = set()  # Set of loaded bucket names (for deduplication)
     _filter_debounce_timer: Timer | None = None  # Debounce timer for server-side filter
     _is_fetching: bool = False  # Prevent duplicate fetch requests
+    _load_generation: int = 0  # Bumped per fresh load; responses from older loads are dropped
     _preserve_position_on_update: bool = False  # Preserve scroll position on next list update
     _saved_scroll_position: int | None = None  # Saved position for restoration after loading more
+    _list_view: ListView | None = None  # Cached inner ListView, set on mount
+    _title_bar: TitleBar | None = None  # Cached screen title bar, looked up on first status update
 
     class BucketSelected(Message):
         """Message sent when a bucket is selected"""
@@ -83,6 +91,9 @@ class BucketList(Static):
         self._preserve_position_on_update = False
         self._saved_scroll_position = None
 
+        # Cache the inner ListView; an ID lookup skips selector parsing
+        self._list_view = self.get_widget_by_id("bucket-list-view", ListView)
+
         # Hide the loading more indicator initially
         try:
             loading_more = self.query_one("#bucket-loading-more", Static)
@@ -93,12 +104,13 @@ class BucketList(Static):
         # Set up scroll monitoring for mouse scroll pagination
         self._setup_scroll_monitoring()
 
-        self.call_later(self.load_buckets)
+        # Let the loading indicator paint before the first S3 call goes out
+        self.call_after_refresh(self.load_buckets)
 
     def _setup_scroll_monitoring(self) -> None:
         """Set up monitoring of scroll position for mouse-based pagination"""
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             # Watch for scroll changes on the list view
             self.watch(list_view, "scroll_y", self._on_list_scroll_change, init=False)
         except Exception:
@@ -131,7 +143,7 @@ class BucketList(Static):
             return
 
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             total_items = len(list_view.children)
 
             if total_items == 0:
@@ -209,22 +221,46 @@ class BucketList(Static):
         Args:
             on_complete: Optional callback to call when loading is complete
         """
+        if self.is_loading:
+            # A fresh load is already running; coalesce into it rather than
+            # issuing a second list_buckets call
+            if on_complete is not None:
+                self._chain_load_complete_callback(on_complete)
+            return
+
         # Reset pagination state for fresh load
         self._all_loaded_buckets = []
         self._loaded_bucket_names = set()
         self._continuation_token = None
         self.has_more_buckets = False
+        # A superseded load-more never reaches the handler that would hide its
+        # indicator, so clear it here along with the rest of the pagination state
+        self.is_loading_more = False
 
         self._on_load_complete_callback = on_complete
         self.is_loading = True
         self._is_fetching = True
+        self._load_generation += 1
         thread = threading.Thread(
             target=self._fetch_buckets,
-            args=(None, False),  # No continuation token, not loading more
+            args=(None, False, self._load_generation),  # No continuation token, not loading more
             daemon=True,
         )
         thread.start()
 
+    def _chain_load_complete_callback(self, on_complete: callable) -> None:
+        """Run on_complete after any callback already waiting on the current load"""
+        previous = self._on_load_complete_callback
+        if previous is None:
+            self._on_load_complete_callback = on_complete
+            return
+
+        def run_both() -> None:
+            previous()
+            on_complete()
+
+        self._on_load_complete_callback = run_both
+
     def _load_more_buckets(self) -> None:
         """Load more buckets (pagination) - triggered by infinite scroll"""
         if self._is_fetching or not self.has_more_buckets or not self._continuation_token:
@@ -232,7 +268,7 @@ class BucketList(Static):
 
         # Save current scroll position BEFORE starting async operation
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             self._saved_scroll_position = list_view.index
         except Exception:
             self._saved_scroll_position = None
@@ -241,7 +277,7 @@ class BucketList(Static):
         self._is_fetching = True
         thread = threading.Thread(
             target=self._fetch_buckets,
-            args=(self._continuation_token, True),  # With token, loading more
+            args=(self._continuation_token, True, self._load_generation),  # With token, loading more
             daemon=True,
         )
         thread.start()
@@ -266,20 +302,38 @@ class BucketList(Static):
     def focus_list_view(self) -> None:
         """Focus the bucket list view and select first item"""
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             if len(list_view.children) > 0:
                 list_view.focus()
                 list_view.index = 0
         except Exception:
             pass
 
+    def get_adjacent_bucket_names(self, bucket_name: str) -> list[str]:
+        """Get the names of the displayed buckets directly above and below a bucket
+
+        Args:
+            bucket_name: The bucket whose neighbours to return
+
+        Returns:
+            Up to two bucket names, empty if the bucket is not displayed
+        """
+        for index, bucket in enumerate(self.buckets):
+            if bucket["name"] == bucket_name:
+                neighbours = self.buckets[max(0, index - 1) : index] + self.buckets[index + 1 : index + 2]
+                return [neighbour["name"] for neighbour in neighbours]
+        return []
+
     # Private methods
-    def _fetch_buckets(self, continuation_token: str | None = None, is_loading_more: bool = False) -> None:
+    def _fetch_buckets(
+        self, continuation_token: str | None = None, is_loading_more: bool = False, generation: int = 0
+    ) -> None:
         """Fetch buckets from S3 in background thread
 
         Args:
             continuation_token: Token for fetching next page of results
             is_loading_more: Whether this is a pagination load (vs initial load)
+            generation: The load generation this request belongs to
         """
         try:
             # Use page size only if pagination is enabled
@@ -295,15 +349,21 @@ class BucketList(Static):
             buckets = self._transform_bucket_data(raw_buckets)
 
             # Capture values for closure
-            self.app.call_later(lambda: self._on_buckets_loaded(buckets, next_token, is_loading_more))
+            self.app.call_later(lambda: self._on_buckets_loaded(buckets, next_token, is_loading_more, generation))
         except Exception as error:
             # Capture exception in closure for thread safety
             captured_error = error
             captured_is_loading_more = is_loading_more
-            self.app.call_later(lambda: self._on_buckets_error(captured_error, captured_is_loading_more))
+            self.app.call_later(
+                lambda: self._on_buckets_error(captured_error, captured_is_loading_more, generation)
+            )
 
     def _on_buckets_loaded(
-        self, buckets: list[dict], next_token: str | None = None, is_loading_more: bool = False
+        self,
+        buckets: list[dict],
+        next_token: str | None = None,
+        is_loading_more: bool = False,
+        generation: int | None = None,
     ) -> None:
         """Handle successful bucket loading
 
@@ -311,7 +371,10 @@ class BucketList(Static):
             buckets: List of bucket data
             next_token: Continuation token for next page
             is_loading_more: Whether this was a pagination load
+            generation: The load generation the response belongs to
         """
+        if generation is not None and generation != self._load_generation:
+            return  # A newer load (e.g. a repeated refresh) has superseded this one
         self._is_fetching = False
 
         # Add new buckets to loaded set (for deduplication)
@@ -343,13 +406,18 @@ class BucketList(Static):
             self._on_load_complete_callback = None  # Clear the callback
             callback()
 
-    def _on_buckets_error(self, error: Exception, is_loading_more: bool = False) -> None:
+    def _on_buckets_error(
+        self, error: Exception, is_loading_more: bool = False, generation: int | None = None
+    ) -> None:
         """Handle bucket loading error
 
         Args:
             error: The exception that occurred
             is_loading_more: Whether this was a pagination load
+            generation: The load generation the response belongs to
         """
+        if generation is not None and generation != self._load_generation:
+            return  # A newer load has superseded this one
         self._is_fetching = False
         self.notify(f"Error loading buckets: {error}", severity="error")
 
@@ -369,14 +437,19 @@ class BucketList(Static):
 
     def _transform_bucket_data(self, raw_buckets: list[dict]) -> list[dict]:
         """Transform raw S3 bucket data"""
-        return [
-            {
-                "name": bucket["Name"],
-                "creation_date": bucket["CreationDate"].strftime("%Y-%m-%d"),
-                "region": bucket.get("BucketRegion", "Unknown"),
-            }
-            for bucket in raw_buckets
-        ]
+        buckets = []
+        for bucket in raw_buckets:
+            region = bucket.get("BucketRegion", "Unknown")
+            buckets.append(
+                {
+                    "name": bucket["Name"],
+                    "creation_date": bucket["CreationDate"].strftime("%Y-%m-%d"),
+                    "region": region,
+                    # Built once here instead of on every BucketItem mount
+                    "region_label": f"Region: {region}",
+                }
+            )
+        return buckets
 
     def _get_filtered_buckets(self) -> list[dict]:
         """Get buckets filtered by current filter text (local filtering)"""
@@ -421,28 +494,64 @@ class BucketList(Static):
             preserve_position: If True, only append new items instead of rebuilding
         """
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
 
             if preserve_position:
                 # When preserving position (loading more), only append new items
                 # This keeps existing items and their highlight state intact
                 existing_names = {child.bucket_name for child in list_view.children if isinstance(child, BucketItem)}
-                for bucket in buckets:
-                    if bucket["name"] not in existing_names:
-                        bucket_item = BucketItem(bucket["name"], bucket["region"])
-                        list_view.append(bucket_item)
+                # Mount the new page in one batch rather than one append per row
+                list_view.extend(
+                    BucketItem(bucket["name"], bucket["region"], bucket["region_label"])
+                    for bucket in buckets
+                    if bucket["name"] not in existing_names
+                )
             else:
-                # Full rebuild for initial load or filter changes
+                # Full rebuild for initial load or filter changes, unless the rows
+                # are exactly what is already mounted (e.g. a refresh with no changes)
+                rows = [(bucket["name"], bucket["region"]) for bucket in buckets]
+                mounted = [
+                    (child.bucket_name, child.aws_region)
+                    for child in list_view.children
+                    if isinstance(child, BucketItem)
+                ]
+                if rows == mounted:
+                    self._saved_scroll_position = None
+                    return
+                stale_indices = self._get_stale_indices(mounted, rows)
+                if stale_indices is not None:
+                    # Narrowing the filter only hides rows, so drop those rather
+                    # than tearing down and re-mounting the survivors
+                    list_view.remove_items(stale_indices)
+                    self._saved_scroll_position = None
+                    return
                 list_view.clear()
-                for bucket in buckets:
-                    bucket_item = BucketItem(bucket["name"], bucket["region"])
-                    list_view.append(bucket_item)
+                list_view.extend(
+                    BucketItem(bucket["name"], bucket["region"], bucket["region_label"]) for bucket in buckets
+                )
 
             # Clear saved position after use
             self._saved_scroll_position = None
         except Exception:
             self._saved_scroll_position = None
 
+    @staticmethod
+    def _get_stale_indices(mounted: list[tuple], rows: list[tuple]) -> list[int] | None:
+        """Get the indices of mounted rows to remove so that the list shows `rows`
+
+        Returns:
+            The indices to remove, or None if `rows` is not an in-order subset of
+            `mounted` and the list has to be rebuilt
+        """
+        stale_indices = []
+        position = 0
+        for index, row in enumerate(mounted):
+            if position < len(rows) and row == rows[position]:
+                position += 1
+            else:
+                stale_indices.append(index)
+        return stale_indices if position == len(rows) else None
+
     def _restore_list_position(self, index: int) -> None:
         """Restore the list view position after a refresh
 
@@ -450,7 +559,7 @@ class BucketList(Static):
             index: The index to restore to
         """
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             if len(list_view.children) > 0:
                 restored_index = min(index, len(list_view.children) - 1)
                 # Set the index and force the ListView to update highlighting
@@ -477,7 +586,7 @@ class BucketList(Static):
     def _focus_first_item(self) -> None:
         """Focus the first item in the list"""
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             if len(list_view.children) > 0:
                 # First, focus the list view itself
                 list_view.focus()
@@ -489,7 +598,7 @@ class BucketList(Static):
     def _move_to_first_item(self) -> None:
         """Move focus to first filtered item without selecting"""
         try:
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             if len(list_view.children) > 0:
                 self._prevent_next_selection = True
                 list_view.focus()
@@ -501,7 +610,7 @@ class BucketList(Static):
         """Update UI elements based on loading state"""
         try:
             loading_indicator = self.query_one("#bucket-loading", LoadingIndicator)
-            list_view = self.query_one("#bucket-list-view", ListView)
+            list_view = self._list_view
             filter_input = self.query_one("#bucket-filter", Input)
 
             if is_loading:
@@ -526,8 +635,9 @@ class BucketList(Static):
     def _update_connection_status(self, error: bool) -> None:
         """Update the connection status in title bar"""
         try:
-            title_bar = self.screen.query_one(TitleBar)
-            title_bar.connection_error = error
+            if self._title_bar is None:
+                self._title_bar = self.screen.query_one(TitleBar)
+            self._title_bar.connection_error = error
         except Exception:
             pass
 
@@ -566,10 +676,14 @@ class BucketList(Static):
 
         self._is_fetching = True
         # Load all remaining buckets so we can do a proper "contains" search
-        thread = threading.Thread(target=self._fetch_all_remaining_buckets, args=(self.filter_text,), daemon=True)
+        thread = threading.Thread(
+            target=self._fetch_all_remaining_buckets,
+            args=(self.filter_text, self._load_generation),
+            daemon=True,
+        )
         thread.start()
 
-    def _fetch_all_remaining_buckets(self, original_filter: str) -> None:
+    def _fetch_all_remaining_buckets(self, original_filter: str, generation: int = 0) -> None:
         """Fetch ALL remaining buckets from server for filtering
 
         Since S3 only supports prefix filtering, we need to load all buckets
@@ -577,6 +691,7 @@ class BucketList(Static):
 
         Args:
             original_filter: The filter text when this request was initiated
+            generation: The load generation this request belongs to
         """
         try:
             continuation_token = self._continuation_token
@@ -600,7 +715,9 @@ class BucketList(Static):
 
             # Capture values for closure
             captured_filter = original_filter
-            self.app.call_later(lambda: self._on_all_buckets_loaded_for_filter(all_new_buckets, captured_filter))
+            self.app.call_later(
+                lambda: self._on_all_buckets_loaded_for_filter(all_new_buckets, captured_filter, generation)
+            )
         except Exception as error:
             captured_error = error
             self.app.call_later(lambda: self._on_filtered_buckets_error(captured_error))
@@ -609,13 +726,18 @@ class BucketList(Static):
         """Handle aborted filter fetch (filter changed during fetch)"""
         self._is_fetching = False
 
-    def _on_all_buckets_loaded_for_filter(self, buckets: list[dict], original_filter: str) -> None:
+    def _on_all_buckets_loaded_for_filter(
+        self, buckets: list[dict], original_filter: str, generation: int | None = None
+    ) -> None:
         """Handle successful loading of all buckets for filtering
 
         Args:
             buckets: List of all newly loaded bucket data
             original_filter: The filter that triggered this load
+            generation: The load generation the response belongs to
         """
+        if generation is not None and generation != self._load_generation:
+            return  # The buckets were reloaded meanwhile; these pages continue a stale listing
         self._is_fetching = False
 
         # Check if filter has changed since request was made
@@ -632,9 +754,13 @@ class BucketList(Static):
         self._continuation_token = None
         self.has_more_buckets = False
 
-        # Re-filter and update display
-        self.buckets = self._get_filtered_buckets()
-        self._update_list_display()
+        # Re-filter and update display. Assigning a changed list already redraws
+        # through watch_buckets; otherwise only the "N+" title count is stale
+        filtered_buckets = self._get_filtered_buckets()
+        if filtered_buckets != self.buckets:
+            self.buckets = filtered_buckets
+        else:
+            self._update_title(len(filtered_buckets), len(self._all_loaded_buckets))
 
     def _on_filtered_buckets_error(self, error: Exception) -> None:
         """Handle server-side filter error"""
@@ -1,4 +1,5 @@
 import threading
+import time
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -8,19 +9,37 @@ from textual.reactive import reactive
 from textual.widgets import Label, ListItem, ListView, LoadingIndicator, Static
 
 from s3ranger.gateways.s3 import S3
-from s3ranger.ui.constants import DEFAULT_DOWNLOAD_DIRECTORY, OBJECT_LIST_PAGE_SIZE, SCROLL_THRESHOLD_ITEMS
-from s3ranger.ui.utils import format_file_size, format_folder_display_text
+from s3ranger.ui.constants import (
+    DEFAULT_DOWNLOAD_DIRECTORY,
+    OBJECT_LIST_PAGE_SIZE,
+    OBJECT_PAGE_CACHE_MAX_ENTRIES,
+    OBJECT_PAGE_CACHE_TTL_SECONDS,
+    SCROLL_THRESHOLD_ITEMS,
+)
+from s3ranger.ui.utils import FOLDER_DISPLAY_PREFIX, format_file_size
 from s3ranger.ui.widgets.breadcrumb import Breadcrumb
 from s3ranger.ui.widgets.sort_overlay import SortOverlay
 
 # Constants
 PARENT_DIR_KEY = ".."
 FILE_ICON = "📄"
+FILE_DISPLAY_PREFIX = f"{FILE_ICON} "
 COLUMN_NAMES = ["Name", "Type", "Modified", "Size"]
 CHECKBOX_CHECKED = "[✓]"
 CHECKBOX_UNCHECKED = "[ ]"
 
 
+def _object_row(object_info: dict) -> dict:
+    """Extract the fields an ObjectItem displays from a UI object dict."""
+    return {
+        "key": object_info.get("key", ""),
+        "is_folder": object_info.get("is_folder", False),
+        "type": object_info.get("type", ""),
+        "modified": object_info.get("modified", ""),
+        "size": object_info.get("size", ""),
+    }
+
+
 class ObjectItem(ListItem):
     """Individual item in the object list representing a file or folder."""
 
@@ -30,22 +49,15 @@ class ObjectItem(ListItem):
     def __init__(self, object_info: dict, show_checkbox: bool = True):
         super().__init__()
         # Extract only the fields we need
-        self.object_info = {
-            "key": object_info.get("key", ""),
-            "is_folder": object_info.get("is_folder", False),
-            "type": object_info.get("type", ""),
-            "modified": object_info.get("modified", ""),
-            "size": object_info.get("size", ""),
-        }
+        self.object_info = _object_row(object_info)
         # Parent directory cannot be selected
         self._can_select = self.object_info["key"] != PARENT_DIR_KEY
         self._show_checkbox = show_checkbox
 
     def _format_object_name(self, name: str, is_folder: bool) -> str:
         """Format object name with appropriate icon."""
-        if is_folder:
-            return format_folder_display_text(name)
-        return f"{FILE_ICON} {name}"
+        # Constant prefixes, so each row costs one concatenation
+        return (FOLDER_DISPLAY_PREFIX if is_folder else FILE_DISPLAY_PREFIX) + name
 
     def _get_checkbox_display(self) -> str:
         """Get the checkbox display string based on selection state."""
@@ -140,8 +152,16 @@ class ObjectList(Static):
     _all_loaded_folders: list[dict] = []  # All folders loaded so far
     _loaded_keys: set = set()  # Set of loaded keys (for deduplication)
     _is_fetching: bool = False  # Prevent duplicate fetch requests
+    _load_generation: int = 0  # Bumped per fresh load; responses from older loads are dropped
     _preserve_position_on_update: bool = False  # Preserve scroll position on next list update
     _saved_scroll_position: int | None = None  # Saved position for restoration after loading more
+    _list_view: ListView | None = None  # Cached inner ListView, set on mount
+
+    # Listing cache (written from background threads, guarded by _page_cache_lock)
+    _page_cache: dict = {}  # (bucket, prefix) -> (fetched_at, first page response)
+    _prefetching: set = set()  # Buckets with a root prefetch in flight
+    _page_cache_epoch: int = 0  # Bumped on invalidation; fetches started before it don't store
+    _page_cache_lock: "threading.Lock | None" = None  # Quoted: threading.Lock is a function before 3.13
 
     class ObjectSelected(Message):
         """Message sent when an object is selected."""
@@ -230,6 +250,13 @@ class ObjectList(Static):
         self._preserve_position_on_update = False
         self._saved_scroll_position = None
 
+        # Cache the inner ListView; an ID lookup skips selector parsing
+        self._list_view = self.get_widget_by_id("object-list", ListView)
+
+        self._page_cache = {}
+        self._prefetching = set()
+        self._page_cache_lock = threading.Lock()
+
         # Hide the loading more indicator initially
         try:
             loading_more = self.query_one("#object-loading-more", Static)
@@ -243,7 +270,7 @@ class ObjectList(Static):
     def _setup_scroll_monitoring(self) -> None:
         """Set up monitoring of scroll position for mouse-based pagination"""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             # Watch for scroll changes on the list view
             self.watch(list_view, "scroll_y", self._on_list_scroll_change, init=False)
         except Exception:
@@ -269,7 +296,7 @@ class ObjectList(Static):
             return
 
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             total_items = len(list_view.children)
 
             if total_items == 0:
@@ -307,7 +334,9 @@ class ObjectList(Static):
         if bucket_name:
             self._clear_selection()
             self.is_loading = True
-            self.current_prefix = ""
+            # Reset the prefix without firing watch_current_prefix; the breadcrumb
+            # is redrawn once below for the bucket and prefix together
+            self.set_reactive(ObjectList.current_prefix, "")
             self._update_breadcrumb()
             self._load_bucket_objects()
 
@@ -350,7 +379,7 @@ class ObjectList(Static):
         """Focus the first item in the list."""
         try:
             # First just make sure the list view is visible
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             list_view.display = True
 
             # Use a slightly longer delay for the actual focus operation
@@ -363,7 +392,7 @@ class ObjectList(Static):
     def _apply_focus(self) -> None:
         """Apply focus to the list view after it's fully rendered."""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             list_view.focus()
             if len(list_view.children) > 0:
                 list_view.index = 0
@@ -375,7 +404,7 @@ class ObjectList(Static):
     def _ensure_focus(self) -> None:
         """Final focus check to ensure the list view maintains focus."""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             if list_view.display and len(list_view.children) > 0:
                 # Check if we're already the focused widget
                 app_focus = self.app.focused
@@ -393,7 +422,7 @@ class ObjectList(Static):
         """Toggle loading indicator and list view visibility based on loading state."""
         try:
             loading_indicator = self.query_one("#object-loading", LoadingIndicator)
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
 
             if is_loading:
                 # When starting to load, immediately hide the list and show the loader
@@ -414,31 +443,81 @@ class ObjectList(Static):
             preserve_position: If True, only append new items instead of rebuilding
         """
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             show_checkbox = not self.folders_only
 
             if preserve_position:
-                # When preserving position (loading more), only append new items
+                # When preserving position (loading more), only mount the new items
                 # This keeps existing items and their highlight state intact
-                existing_keys = {child.object_key for child in list_view.children if isinstance(child, ObjectItem)}
-                for obj in self.objects:
-                    if obj["key"] not in existing_keys:
-                        list_view.append(ObjectItem(obj, show_checkbox=show_checkbox))
-            else:
-                # Full rebuild for initial load or navigation
+                mounted_keys = [child.object_key for child in list_view.children if isinstance(child, ObjectItem)]
+                existing_keys = set(mounted_keys)
+                if [obj["key"] for obj in self.objects if obj["key"] in existing_keys] != mounted_keys:
+                    # The mounted rows are no longer in display order; rebuild instead
+                    preserve_position = False
+                else:
+                    self._insert_new_items(list_view, existing_keys, show_checkbox)
+
+            if not preserve_position:
+                # Full rebuild for initial load or navigation, unless the rows are
+                # exactly what is already mounted (e.g. a refresh with no changes)
+                mounted = [child for child in list_view.children if isinstance(child, ObjectItem)]
+                if len(mounted) == len(self.objects) and all(
+                    item.object_info == _object_row(obj) for item, obj in zip(mounted, self.objects)
+                ):
+                    # Refresh drops the selection, so reset the reused rows to match
+                    for item in mounted:
+                        item.is_selected = False
+                    self._saved_scroll_position = None
+                    return
                 list_view.clear()
-                for obj in self.objects:
-                    list_view.append(ObjectItem(obj, show_checkbox=show_checkbox))
+                list_view.extend(ObjectItem(obj, show_checkbox=show_checkbox) for obj in self.objects)
 
             # Clear saved position after use
             self._saved_scroll_position = None
         except Exception:
             self._saved_scroll_position = None
 
+    def _insert_new_items(self, list_view: ListView, existing_keys: set[str], show_checkbox: bool) -> None:
+        """Mount rows missing from the list view at their positions in self.objects.
+
+        A new page doesn't always sort after the rows already shown (streamed
+        pages bring more folders, and sorting interleaves), so rows are inserted
+        in place to keep list indices lined up with self.objects.
+
+        Args:
+            list_view: The list view to mount into
+            existing_keys: Keys of the rows already mounted
+            show_checkbox: Whether new rows show a selection checkbox
+        """
+        highlighted = list_view.index
+        shift = 0
+        run_start = 0
+        run: list[ObjectItem] = []
+        for index, obj in enumerate(self.objects):
+            if obj["key"] not in existing_keys:
+                if not run:
+                    run_start = index
+                run.append(ObjectItem(obj, show_checkbox=show_checkbox))
+                continue
+            if run:
+                # Mount each contiguous run of new rows in one batch
+                list_view.insert(run_start, run)
+                if highlighted is not None and run_start <= highlighted + shift:
+                    shift += len(run)
+                run = []
+        if run:
+            list_view.extend(run)
+
+        # Keep the highlight on the same row it was on before the insert
+        if highlighted is not None and shift:
+            list_view.index = highlighted + shift
+
     def _load_bucket_objects(self) -> None:
         """Load objects from the current S3 bucket prefix (initial load)."""
         if not self.current_bucket:
             self._clear_objects()
+            # Nothing to fetch, but a pending refresh still needs to hear it finished
+            self._execute_completion_callback()
             return
 
         # Reset pagination state for fresh load
@@ -447,12 +526,16 @@ class ObjectList(Static):
         self._loaded_keys = set()
         self._continuation_token = None
         self.has_more_objects = False
+        # A superseded load-more never reaches the handler that would hide its
+        # indicator, so clear it here along with the rest of the pagination state
+        self.is_loading_more = False
         self._is_fetching = True
+        self._load_generation += 1
 
         # Start asynchronous loading
         thread = threading.Thread(
             target=self._fetch_objects,
-            args=(None, False),  # No continuation token, not loading more
+            args=(None, False, self._load_generation),  # No continuation token, not loading more
             daemon=True,
         )
         thread.start()
@@ -464,7 +547,7 @@ class ObjectList(Static):
 
         # Save current scroll position BEFORE starting async operation
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             self._saved_scroll_position = list_view.index
         except Exception:
             self._saved_scroll_position = None
@@ -473,40 +556,68 @@ class ObjectList(Static):
         self._is_fetching = True
         thread = threading.Thread(
             target=self._fetch_objects,
-            args=(self._continuation_token, True),  # With token, loading more
+            args=(self._continuation_token, True, self._load_generation),  # With token, loading more
             daemon=True,
         )
         thread.start()
 
-    def _fetch_objects(self, continuation_token: str | None = None, is_loading_more: bool = False) -> None:
+    def _fetch_objects(
+        self, continuation_token: str | None = None, is_loading_more: bool = False, generation: int = 0
+    ) -> None:
         """Fetch objects from S3 in background thread.
 
         Args:
             continuation_token: Token for fetching next page of results
             is_loading_more: Whether this is a pagination load (vs initial load)
+            generation: The load generation this request belongs to
         """
         try:
             # Use page size only if pagination is enabled
             enable_pagination = getattr(self.app, "enable_pagination", True)
             max_keys = OBJECT_LIST_PAGE_SIZE if enable_pagination else None
-
-            response = S3.list_objects_for_prefix_paginated(
-                bucket_name=self.current_bucket,
-                prefix=self.current_prefix,
-                max_keys=max_keys,
-                continuation_token=continuation_token,
-            )
-            files = response["files"]
-            folders = response["folders"]
-            next_token = response["continuation_token"]
-
-            # Capture values for closure
-            self.app.call_later(lambda: self._on_objects_loaded(files, folders, next_token, is_loading_more))
+            bucket_name = self.current_bucket
+            prefix = self.current_prefix
+            cache_epoch = self._page_cache_epoch
+
+            while True:
+                # The first page of a listing is served from cache when fresh, so
+                # navigating back into a folder doesn't cost a round trip
+                response = None
+                if continuation_token is None:
+                    response = self._get_cached_page(bucket_name, prefix)
+                if response is None:
+                    response = S3.list_objects_for_prefix_paginated(
+                        bucket_name=bucket_name,
+                        prefix=prefix,
+                        max_keys=max_keys,
+                        continuation_token=continuation_token,
+                    )
+                    if continuation_token is None:
+                        self._store_cached_page(bucket_name, prefix, response, cache_epoch)
+                files = response["files"]
+                folders = response["folders"]
+                next_token = response["continuation_token"]
+
+                # Bind values as defaults; the loop rebinds the names before the UI runs
+                self.app.call_later(
+                    lambda f=files, d=folders, t=next_token, more=is_loading_more: self._on_objects_loaded(
+                        f, d, t, more, generation
+                    )
+                )
+
+                # With pagination disabled there is no scroll-triggered load, so
+                # stream the remaining pages in, appending each one as it arrives
+                if enable_pagination or not next_token or generation != self._load_generation:
+                    break
+                continuation_token = next_token
+                is_loading_more = True
         except Exception as error:
             # Capture exception in closure for thread safety
             captured_error = error
             captured_is_loading_more = is_loading_more
-            self.app.call_later(lambda: self._on_objects_error(captured_error, captured_is_loading_more))
+            self.app.call_later(
+                lambda: self._on_objects_error(captured_error, captured_is_loading_more, generation)
+            )
 
     def _on_objects_loaded(
         self,
@@ -514,6 +625,7 @@ class ObjectList(Static):
         folders: list[dict],
         next_token: str | None = None,
         is_loading_more: bool = False,
+        generation: int | None = None,
     ) -> None:
         """Handle successful objects loading.
 
@@ -522,7 +634,10 @@ class ObjectList(Static):
             folders: List of folder prefixes
             next_token: Continuation token for next page
             is_loading_more: Whether this was a pagination load
+            generation: The load generation the response belongs to
         """
+        if generation is not None and generation != self._load_generation:
+            return  # A newer load (another bucket or prefix) has superseded this one
         self._is_fetching = False
 
         # Add new folders to loaded set (for deduplication)
@@ -563,13 +678,18 @@ class ObjectList(Static):
 
         self._execute_completion_callback()
 
-    def _on_objects_error(self, error: Exception, is_loading_more: bool = False) -> None:
+    def _on_objects_error(
+        self, error: Exception, is_loading_more: bool = False, generation: int | None = None
+    ) -> None:
         """Handle objects loading error.
 
         Args:
             error: The exception that occurred
             is_loading_more: Whether this was a pagination load
+            generation: The load generation the response belongs to
         """
+        if generation is not None and generation != self._load_generation:
+            return  # A newer load has superseded this one
         self._is_fetching = False
         self.notify(f"Error loading bucket objects: {error}", severity="error")
 
@@ -604,7 +724,7 @@ class ObjectList(Static):
     def _clear_selection(self) -> None:
         """Clear list selection and hide the list view during navigation."""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             list_view.index = None
             list_view.display = False
         except Exception:
@@ -614,27 +734,33 @@ class ObjectList(Static):
     def _build_and_set_objects(self) -> None:
         """Build UI objects from loaded files and folders and set the objects property."""
         ui_objects = []
+        # Hoisted out of the loops: current_prefix is a reactive descriptor, and
+        # these run once per listed object
+        current_prefix = self.current_prefix
+        add_object = ui_objects.append
+        create_folder_object = self._create_folder_object
+        create_file_object = self._create_file_object
 
         # Add parent directory navigation if in a subfolder
-        if self.current_prefix:
-            ui_objects.append(self._create_parent_dir_object())
+        if current_prefix:
+            add_object(self._create_parent_dir_object())
 
         # Add folders
         for folder in self._all_loaded_folders:
             prefix = folder.get("Prefix", "")
             # Extract folder name by removing the current prefix and trailing slash
-            folder_name = prefix[len(self.current_prefix) :].rstrip("/")
+            folder_name = prefix.removeprefix(current_prefix).rstrip("/")
             if folder_name:  # Only add if we get a valid folder name
-                ui_objects.append(self._create_folder_object(folder_name))
+                add_object(create_folder_object(folder_name))
 
         # Add files (skip if folders_only mode is enabled)
         if not self.folders_only:
             for s3_object in self._all_loaded_files:
                 key = s3_object.get("Key", "")
                 # Extract filename by removing the current prefix
-                filename = key[len(self.current_prefix) :]
+                filename = key.removeprefix(current_prefix)
                 if filename:  # Only add if we get a valid filename
-                    ui_objects.append(self._create_file_object(filename, s3_object))
+                    add_object(create_file_object(filename, s3_object))
 
         self._unsorted_objects = ui_objects
 
@@ -678,6 +804,7 @@ class ObjectList(Static):
             "key": filename,
             "is_folder": False,
             "size": format_file_size(s3_object["Size"]),
+            "size_bytes": s3_object["Size"],
             "modified": s3_object["LastModified"].strftime("%Y-%m-%d %H:%M"),
             "type": self._get_file_extension(filename),
         }
@@ -707,11 +834,8 @@ class ObjectList(Static):
         self._prepare_for_navigation()
 
         # Calculate parent directory path
-        path_parts = self.current_prefix.rstrip("/").split("/")
-        if len(path_parts) > 1:
-            self.current_prefix = "/".join(path_parts[:-1]) + "/"
-        else:
-            self.current_prefix = ""
+        parent, separator, _ = self.current_prefix.rstrip("/").rpartition("/")
+        self.current_prefix = f"{parent}/" if separator else ""
 
         self._load_bucket_objects()
 
@@ -738,7 +862,7 @@ class ObjectList(Static):
     def get_focused_object(self) -> dict | None:
         """Get the currently focused object in the list."""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             if list_view.index is None or not self.objects:
                 return
 
@@ -767,9 +891,106 @@ class ObjectList(Static):
             on_complete: Optional callback to call when loading is complete
         """
         self._on_load_complete_callback = on_complete
+        # A refresh must hit S3, not a listing cached before the change
+        self._invalidate_page_cache()
         self._prepare_for_navigation()  # Reuse navigation preparation logic
         self._load_bucket_objects()
 
+    def prefetch_bucket(self, bucket_name: str) -> None:
+        """Fetch the root listing of a bucket in the background so opening it is instant.
+
+        Args:
+            bucket_name: The bucket to prefetch
+        """
+        if not bucket_name or bucket_name == self.current_bucket or self._page_cache_lock is None:
+            return
+
+        with self._page_cache_lock:
+            if bucket_name in self._prefetching:
+                return
+        if self._get_cached_page(bucket_name, "") is not None:
+            return
+        with self._page_cache_lock:
+            self._prefetching.add(bucket_name)
+
+        thread = threading.Thread(target=self._prefetch_objects, args=(bucket_name,), daemon=True)
+        thread.start()
+
+    def _prefetch_objects(self, bucket_name: str) -> None:
+        """Fetch the first page of a bucket's root listing in a background thread.
+
+        Args:
+            bucket_name: The bucket to prefetch
+        """
+        cache_epoch = self._page_cache_epoch
+        try:
+            enable_pagination = getattr(self.app, "enable_pagination", True)
+            response = S3.list_objects_for_prefix_paginated(
+                bucket_name=bucket_name,
+                prefix="",
+                max_keys=OBJECT_LIST_PAGE_SIZE if enable_pagination else None,
+            )
+            self._store_cached_page(bucket_name, "", response, cache_epoch)
+        except Exception:
+            # Best effort only; a real load of the bucket reports its own errors
+            pass
+        finally:
+            with self._page_cache_lock:
+                self._prefetching.discard(bucket_name)
+
+    def _invalidate_page_cache(self) -> None:
+        """Drop every cached listing page.
+
+        Called after any change to bucket contents; a mutation may affect
+        prefixes other than the one being shown, so the whole cache goes.
+        """
+        if self._page_cache_lock is None:
+            return
+        with self._page_cache_lock:
+            self._page_cache.clear()
+            self._page_cache_epoch += 1
+
+    def _get_cached_page(self, bucket_name: str, prefix: str) -> dict | None:
+        """Get the cached first page of a listing if it is still fresh.
+
+        Args:
+            bucket_name: The bucket being listed
+            prefix: The prefix being listed
+
+        Returns:
+            The cached list_objects_for_prefix_paginated response, or None
+        """
+        if self._page_cache_lock is None:
+            return None
+        with self._page_cache_lock:
+            entry = self._page_cache.get((bucket_name, prefix))
+        if entry is None or time.monotonic() - entry[0] >= OBJECT_PAGE_CACHE_TTL_SECONDS:
+            return None
+        return entry[1]
+
+    def _store_cached_page(self, bucket_name: str, prefix: str, response: dict, cache_epoch: int) -> None:
+        """Cache the first page of a listing, evicting the oldest entries past the size cap.
+
+        Args:
+            bucket_name: The bucket that was listed
+            prefix: The prefix that was listed
+            response: The list_objects_for_prefix_paginated response for the first page
+            cache_epoch: The cache epoch captured before the request was sent
+        """
+        if self._page_cache_lock is None:
+            return
+        with self._page_cache_lock:
+            if cache_epoch != self._page_cache_epoch:
+                # The cache was invalidated while this request was in flight, so
+                # the response may predate the change that invalidated it
+                return
+            key = (bucket_name, prefix)
+            # Re-insert so dict order stays oldest-first
+            self._page_cache.pop(key, None)
+            self._page_cache[key] = (time.monotonic(), response)
+            while len(self._page_cache) > OBJECT_PAGE_CACHE_MAX_ENTRIES:
+                del self._page_cache[next(iter(self._page_cache))]
+
     def focus_list(self) -> None:
         """Focus the object list view."""
         self._focus_first_item()  # Reuse focus logic
@@ -883,7 +1104,9 @@ class ObjectList(Static):
             if result:
                 # Delete was successful
                 if deleting_all and self.current_prefix:
-                    # All items were deleted and we're not at bucket root, navigate up
+                    # All items were deleted and we're not at bucket root, navigate up.
+                    # The parent's cached page still lists the emptied folder
+                    self._invalidate_page_cache()
                     self._navigate_up()
                 else:
                     # Just refresh the view normally
@@ -1113,54 +1336,14 @@ class ObjectList(Static):
         if is_folder:
             return (0, 0)  # Folders have no size, sort first
 
-        size_str = obj.get("size", "")
-        if not size_str:
-            return (1, 0)
-
-        # Parse size string to get numeric value for proper sorting
-        try:
-            # Remove units and convert to bytes for comparison
-            size_bytes = self._parse_size_to_bytes(size_str)
-            return (1, size_bytes)
-        except Exception:
-            return (1, 0)
-
-    def _parse_size_to_bytes(self, size_str: str) -> int:
-        """Parse size string like '1.2 MB' to bytes for sorting."""
-        if not size_str:
-            return 0
-
-        size_str = size_str.strip().upper()
-
-        # Define units with their multipliers - check longer units first
-        units = [
-            ("TB", 1024**4),
-            ("GB", 1024**3),
-            ("MB", 1024**2),
-            ("KB", 1024),
-            ("B", 1),
-        ]
-
-        # Check for unit suffix
-        for unit, multiplier in units:
-            if size_str.endswith(unit):
-                number_part = size_str[: -len(unit)].strip()
-                try:
-                    return int(float(number_part) * multiplier)
-                except ValueError:
-                    return 0
-
-        # Try to parse as plain number
-        try:
-            return int(float(size_str))
-        except ValueError:
-            return 0
+        # Raw byte count kept from the listing; the display string is rounded
+        return (1, obj.get("size_bytes", 0))
 
     # Multi-selection methods
     def action_toggle_selection(self) -> None:
         """Toggle selection of the currently focused item."""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             if list_view.index is None:
                 return
 
@@ -1183,7 +1366,7 @@ class ObjectList(Static):
     def action_select_all(self) -> None:
         """Select all items in the current view."""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             for child in list_view.children:
                 if isinstance(child, ObjectItem) and child.can_select:
                     if not child.is_selected:
@@ -1202,7 +1385,7 @@ class ObjectList(Static):
     def _clear_all_selections(self) -> None:
         """Internal method to clear all selections."""
         try:
-            list_view = self.query_one("#object-list", ListView)
+            list_view = self._list_view
             for child in list_view.children:
                 if isinstance(child, ObjectItem):
                     child.is_selected = False
@@ -1226,15 +1409,16 @@ class ObjectList(Static):
         if not self.current_bucket:
             return []
 
+        # The bucket and prefix are shared by every selected item, so format them once
+        base_uri = f"s3://{self.current_bucket}/{self.current_prefix}"
         uris = []
         for obj in self.get_selected_objects():
             key = obj.get("key", "")
             if key and key != "..":
                 if obj.get("is_folder"):
-                    full_path = f"{self.current_prefix}{key}/"
+                    uris.append(f"{base_uri}{key}/")
                 else:
-                    full_path = f"{self.current_prefix}{key}"
-                uris.append(f"s3://{self.current_bucket}/{full_path}")
+                    uris.append(f"{base_uri}{key}")
         return uris
 
     def has_selection(self) -> bool: